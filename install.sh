@@ -7,5 +7,5 @@
 
 cd "$(dirname "$0")"
 
-# use pip to install the cli from the current directory (via setup.py)
+# use pip to install the cli from the current directory (via pyproject.toml)
 pip install -e . --upgrade --force-reinstall
\ No newline at end of file
@@ -0,0 +1,209 @@
+"""sbx dataset commands, loaded by the top level cli only when `sbx dataset` is invoked."""
+
+import os
+
+import click
+
+from sbx.cli.cli import (_SORT_DESC, check_object_id, print_table, sbx_post, sbx_style,
+                         write_json_atomic)
+
+# written into the download dir after a complete `sbx dataset download`, listing every file with
+# its size and etag so that a rerun can tell the dataset is already there without listing S3
+DOWNLOAD_MANIFEST = '.sbx_manifest.json'
+
+
+@click.group()
+def dataset():
+    """list dataset related commands"""
+    pass
+
+
+@dataset.command()
+@click.argument("project_id")
+def list(project_id):
+    """list all datasets belonging to a project
+    """
+    check_object_id(project_id)
+    res = sbx_post("/datasets/get",
+                   json={"project_id": project_id, "sort": _SORT_DESC})
+    if not res:
+        return
+    headers = ['Id', 'Date Shipped', 'Name']
+    rows = ((
+        ds['id'],
+        ds['created_str_utc'],
+        ds['name']
+    ) for ds in res['datasets'])
+    print_table(rows, headers=headers)
+
+
+@dataset.command()
+@click.argument("dataset_id")
+def info(dataset_id):
+    """show detailed info about a project
+    Note: dataset_id refers to the id shown in the dataset list command,
+    not the sbx internal id.
+    """
+    check_object_id(dataset_id)
+    res = sbx_post("/dataset/get", json={"id": dataset_id})
+    if not res:
+        return
+    print_table(res['dataset'].items())
+
+
+def download_is_complete(manifest_path, download_dir, bucket, prefix):
+    """check whether a previous download of s3://bucket/prefix into download_dir finished,
+    by comparing the sizes in its manifest against the files on disk.
+    """
+    import orjson
+    try:
+        with open(manifest_path, 'rb') as file:
+            manifest = orjson.loads(file.read())
+        if manifest['bucket'] != bucket or manifest['prefix'] != prefix:
+            return False
+        if not manifest['files']:
+            # an empty listing, e.g. a dataset that wasn't uploaded yet, must be fetched again
+            return False
+        for key, meta in manifest['files'].items():
+            if os.stat(os.path.join(download_dir, key)).st_size != meta['size']:
+                return False
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        # no manifest, a manifest we can't read, or a file that has since been removed
+        return False
+    return True
+
+
+@dataset.command()
+@click.argument("dataset_id")
+@click.argument("download_dir")
+@click.option("-s", "--sample", is_flag=True, help="whether to download the full dataset or the smaller sample with 100 images")
+def download(dataset_id, download_dir, sample):
+    """download a dataset locally to a specified location
+    """
+    from urllib.parse import urlparse
+
+    check_object_id(dataset_id)
+    # the only credential we need to store locally is the API key
+    res = sbx_post('/user/get-aws-creds', json={"id": dataset_id})
+    s3_bucket_path = res['synth_full_dataset_uri']
+    if sample:
+        s3_bucket_path = res['synth_sample_dataset_uri']
+
+    if not os.path.exists(download_dir):
+        create = click.prompt(sbx_style(
+            f"The path `{download_dir}` doesn't exist. Create it and download?"))
+        if create in ['Y', 'y']:
+            os.makedirs(download_dir)
+        else:
+            return
+
+    # boto3 does not support a clean aws sync command so we will download all files manually
+    # through a single transfer manager, which schedules every GET on one shared thread and
+    # connection pool instead of nesting download_file's own threads inside a thread pool.
+
+    bucket_name = urlparse(res['dataset_uri']).netloc
+    prefix_path = urlparse(s3_bucket_path).path[1:]  # get rid of leading /
+
+    manifest_path = os.path.join(download_dir, DOWNLOAD_MANIFEST)
+    if download_is_complete(manifest_path, download_dir, bucket_name, prefix_path):
+        click.echo(sbx_style("Dataset Ready!"))
+        return
+
+    import threading
+
+    import boto3
+    from boto3.s3.transfer import TransferConfig, TransferManager
+    from botocore.config import Config
+    from s3transfer.subscribers import BaseSubscriber
+    from tqdm import tqdm
+
+    # Creating only one session and one client
+    session = boto3.Session()
+    client = session.client("s3",
+                            aws_access_key_id=res['access_key'],
+                            aws_secret_access_key=res['secret_key'],
+                            # allow as many pooled connections as concurrent transfers
+                            config=Config(max_pool_connections=64)
+                            )
+    # larger io chunks mean fewer write() syscalls per downloaded file (the default is 256KB)
+    transfer_config = TransferConfig(max_concurrency=64, use_threads=True, max_io_queue=1000,
+                                     io_chunksize=1024 * 1024)
+    paginator = client.get_paginator('list_objects_v2')
+
+    # List for storing possible failed downloads to retry later
+    failed_downloads = []
+    # size and etag of every file that is verified on disk or downloaded, saved as the manifest
+    # once all of them are there
+    manifest_files = {}
+
+    # a single walk of the download dir instead of a stat per object, to skip files we already have.
+    # sizes are kept so that a truncated or stale file is downloaded again
+    existing_files = {
+        os.path.relpath(path, download_dir).replace(os.sep, '/'): os.stat(path).st_size
+        for root, _, names in os.walk(download_dir)
+        for path in (os.path.join(root, name) for name in names)
+    }
+
+    click.echo(sbx_style("Starting download..."))
+    with tqdm(total=0) as pbar:
+        pbar_lock = threading.Lock()
+
+        class ProgressSubscriber(BaseSubscriber):
+            """advances the progress bar as each download finishes, while listing is still going"""
+
+            def on_done(self, future, **kwargs):
+                with pbar_lock:
+                    pbar.update(1)
+
+        progress = ProgressSubscriber()
+        with TransferManager(client, transfer_config) as manager:
+            # Using a dict for preserving the downloaded file for each future, to store it as a failure if we need that
+            # or add it to the manifest once it's done
+            futures = {}
+            # most keys share a directory, so only create each directory the first time we see it
+            seen_dirs = set()
+            # downloads are submitted as each page of keys is listed, so listing overlaps with downloading
+            for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix_path):
+                for obj in page.get('Contents', []):
+                    file_to_download = obj['Key']
+                    local_filename = os.path.join(download_dir, file_to_download)
+                    local_file_dir = os.path.dirname(local_filename)
+                    if local_file_dir not in seen_dirs:
+                        os.makedirs(local_file_dir, exist_ok=True)
+                        seen_dirs.add(local_file_dir)
+                    if file_to_download.endswith('/'):
+                        continue
+                    meta = {'size': obj['Size'], 'etag': obj['ETag']}
+                    if existing_files.get(file_to_download) == obj['Size']:
+                        manifest_files[file_to_download] = meta
+                    else:
+                        futures[manager.download(
+                            bucket_name, file_to_download, local_filename,
+                            subscribers=[progress])] = (file_to_download, meta)
+                with pbar_lock:
+                    pbar.total = len(futures)
+                    pbar.refresh()
+
+            for future, (file_to_download, meta) in futures.items():
+                try:
+                    future.result()
+                except Exception:
+                    failed_downloads.append(file_to_download)
+                else:
+                    manifest_files[file_to_download] = meta
+    if len(failed_downloads) > 0:
+        click.echo(
+            sbx_style("Some downloads have failed. Try rerunning"))
+    elif not manifest_files:
+        # no manifest, so the next run lists the dataset again instead of treating it as complete
+        click.echo(
+            sbx_style("No files were found for this dataset. Try rerunning later"))
+    else:
+        write_json_atomic(manifest_path, {
+            'bucket': bucket_name,
+            'prefix': prefix_path,
+            'files': manifest_files
+        })
+        click.echo(
+            sbx_style("Dataset Ready!")
+        )
@@ -0,0 +1,54 @@
+"""sbx generator commands, loaded by the top level cli only when `sbx generator` is invoked."""
+
+import click
+
+from sbx.cli.cli import _SORT_DESC, check_object_id, print_table, sbx_post, sbx_style
+
+
+@click.group()
+def generator():
+    """list generator related commands"""
+    pass
+
+
+@generator.command()
+@click.argument("project_id")
+def list(project_id):
+    """list all generators attached to a project
+    """
+    check_object_id(project_id)
+    res = sbx_post("/generators/get",
+                   json={"project_id": project_id, "sort": _SORT_DESC})
+    if not res:
+        return
+    headers = ['Id', 'Name', 'Build Name']
+    rows = ((
+        gen['id'],
+        gen['name'],
+        gen['cur_build_name']
+    ) for gen in res['generators'])
+    print_table(rows, headers=headers)
+
+
+@generator.command()
+@click.argument("generator_id")
+def info(generator_id):
+    """show detailed info about a particular generator
+    """
+    check_object_id(generator_id)
+    res = sbx_post("/generator/get", json={"id": generator_id})
+    if not res:
+        return
+    print_table(res.items())
+
+@generator.command()
+@click.argument("generator_id")
+@click.argument("num_frames", type = int)
+@click.argument("scene_args_str")
+def generate(generator_id, num_frames, scene_args_str):
+    """submit a generation job for a synthetic dataset"""
+    check_object_id(generator_id)
+    res = sbx_post("/generator/create-dataset", json={"id": generator_id, "num_frames": num_frames, "scene_args_str": scene_args_str})
+    if not res:
+        return
+    click.echo(sbx_style(f"Success! Use `sbx job info {res['job_id']}` or `sbx job list` to monitor the status of your job."))
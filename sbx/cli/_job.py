@@ -0,0 +1,51 @@
+"""sbx job commands, loaded by the top level cli only when `sbx job` is invoked."""
+
+import click
+
+from sbx.cli.cli import (_SORT_DESC, JobState, check_dataset_job_id, check_object_id, print_table,
+                         sbx_post)
+
+# resolved once here rather than going through the enum machinery for every row
+_JOBSTATE_NAMES = {state.value: state.name for state in JobState}
+
+
+@click.group()
+def job():
+    """list aws job related commands"""
+    pass
+
+
+@job.command()
+@click.argument("project_id", default=None, required=False)
+def list(project_id):
+    """list current running and completed aws jobs
+    """
+    check_object_id(project_id)
+    query = {"sort": _SORT_DESC}
+    if project_id:
+        query['project_id'] = project_id
+    res = sbx_post("/dataset-jobs/get",
+                   json=query)
+    if not res:
+        return
+    headers = ['Id', 'Created', 'Finished', 'Name', 'State']
+    rows = ((
+        ds['id'],
+        ds['created_utc'],
+        ds['finished_utc'],
+        ds['name'],
+        _JOBSTATE_NAMES[int(ds['state'])]
+    ) for ds in res['dataset_jobs'])
+    print_table(rows, headers=headers)
+
+
+@job.command()
+@click.argument("job_id")
+def info(job_id):
+    """list current running and completed aws jobs
+    """
+    check_dataset_job_id(job_id)
+    res = sbx_post("/dataset-job/get", json={"id": job_id})
+    if not res:
+        return
+    print_table(res['dataset_job'].items())
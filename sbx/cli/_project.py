@@ -0,0 +1,46 @@
+"""sbx project commands, loaded by the top level cli only when `sbx project` is invoked."""
+
+import click
+
+from sbx.cli.cli import _SORT_DESC, check_object_id, print_table, sbx_post
+
+
+@click.group()
+def project():
+    """list project related commands"""
+    pass
+
+
+@project.command()
+def list():
+    """list user projects"""
+    res = sbx_post("/projects/get", json={"sort": _SORT_DESC})
+    if not res:
+        return
+    headers = ['Id', 'Date Created', 'Name']
+    rows = ((
+        proj['project_id'],
+        proj['created_str_utc'],
+        proj['name']
+    ) for proj in res['projects'])
+    print_table(rows, headers=headers)
+
+
+@project.command()
+@click.argument("project_ids", nargs=-1, required=True)
+def info(project_ids):
+    """show detailed info about one or more projects"""
+    for project_id in project_ids:
+        check_object_id(project_id)
+    if len(project_ids) == 1:
+        res = sbx_post("/project/get", json={"id": project_ids[0]})
+        if not res:
+            return
+        print_table(res.items())
+        return
+    # fetch all the projects in a single round trip rather than one request per id
+    res = sbx_post("/project/get-many", json={"ids": [*project_ids]})
+    if not res:
+        return
+    for proj in res['projects']:
+        print_table(proj.items())
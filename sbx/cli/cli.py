@@ -1,19 +1,15 @@
 
 #!/usr/bin/env python
+# Heavier dependencies (boto3, httpx, tqdm, ...) are imported inside the functions that
+# use them, so that commands which don't need them start up quickly.
+import importlib
+import math
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import re
 from enum import Enum
-from functools import partial, wraps
-from urllib.parse import urlparse
+from functools import wraps
 
-import boto3
 import click
-import requests
-import toml
-from bson import ObjectId
-from bson.errors import InvalidId
-from tabulate import tabulate
-from tqdm import tqdm
 
 # TODO (T2600): Potentially support active context (i.e. checkout a project) to avoid having to specify ids each time.
 
@@ -23,9 +19,39 @@ if os.getenv('SBX_DEV'):
     click.echo("Running SBX CLI in dev mode. No SSL verification will be used. `export SBX_DEV=` to test for prod")
     VERIFY = False
     SBX_API_URL_BASE = "https://dev.app.sbxrobotics.com"
+_API_V0 = SBX_API_URL_BASE + "/app-api/v0"
 
 CONFIG_DIR = os.path.expanduser('~/.config/sbx/')
 CONFIG_PATH = os.path.join(CONFIG_DIR, 'config.toml')
+# pickled copy of the parsed config, so we don't have to parse toml on every invocation
+CONFIG_CACHE_PATH = CONFIG_PATH + '.pkl'
+
+# short lived on-disk cache of api responses, see sbx_post
+CACHE_DIR = os.path.expanduser('~/.cache/sbx/')
+# seconds a cached response is reused without asking the server. `export SBX_CACHE_TTL=0` to always
+# revalidate with the server (which can still answer 304 Not Modified for an unchanged ETag).
+# a value that isn't a finite number (including inf and nan, which can't be stored as an expiry
+# time) falls back to the default rather than breaking every command
+try:
+    RESPONSE_CACHE_TTL = float(os.getenv('SBX_CACHE_TTL', 30))
+except ValueError:
+    RESPONSE_CACHE_TTL = 30.0
+if not math.isfinite(RESPONSE_CACHE_TTL):
+    RESPONSE_CACHE_TTL = 30.0
+# routes that only read data, so their responses can be cached. dataset job routes are left out on
+# purpose since job state is exactly what users poll for.
+CACHEABLE_ROUTES = {
+    "/projects/get",
+    "/project/get",
+    "/project/get-many",
+    "/generators/get",
+    "/generator/get",
+    "/datasets/get",
+    "/dataset/get",
+}
+
+# shared http client, created on first use by get_client()
+_CLIENT = None
 
 
 class JobState(Enum):
@@ -37,15 +63,30 @@ class JobState(Enum):
     SHIP = 40
     ERROR = 1000
 
-    @classmethod
-    def get_name(cls, val):
-        return cls(val).name
-
 
 class SortOrder(Enum):
     ASC = 10
     DESC = 20
 
+
+# resolved once here rather than going through the enum machinery in every command
+_SORT_DESC = SortOrder.DESC.value
+
+# a well formed object id is 24 hex characters
+_OID_RE = re.compile(r'[0-9a-fA-F]{24}')
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
+# styled once here instead of rebuilding the ansi codes for every message
+_SBX_PREFIX = click.style("sbx", fg="cyan") + ": "
+_EMAIL_LABEL = click.style("Email", fg="cyan") + ": "
+_NAME_LABEL = click.style("Name", fg="cyan") + ": "
+_ORGANIZATION_LABEL = click.style("Organization", fg="cyan") + ": "
+# fixed error messages of sbx_post
+_MSG_BAD_KEY = _SBX_PREFIX + (
+    "Are you using an valid API key for the resource you are trying to access? "
+    f"Please enter a key currently listed at {SBX_API_URL_BASE}/settings/account")
+_MSG_500 = _SBX_PREFIX + "Internal Server Error: Please retry in a bit."
+
 #
 # Utility functions
 #
@@ -59,138 +100,359 @@ def sbx_style(msg):
     msg : str
         message to style
     """
-    return click.style("sbx", fg="cyan") + ": " + msg
+    return _SBX_PREFIX + msg
+
+
+def print_table(rows, headers=None):
+    """print rows as a grid table
+
+    Parameters
+    ----------
+    rows : iterable of tuple
+        table rows
+    headers : list of str, optional
+        column titles, leave empty for key/value tables
+    """
+    from rich import box
+    from rich.console import Console
+    from rich.table import Table
+    from rich.text import Text
+    table = Table(*(headers or ()), show_header=bool(headers), show_lines=True, box=box.SQUARE)
+    for row in rows:
+        # Text keeps rich from interpreting brackets in api values as markup, and folding long
+        # values onto more lines keeps them whole where rich would otherwise cut them with an ellipsis
+        table.add_row(*(Text(str(cell), overflow='fold') for cell in row))
+    console = Console()
+    if not console.is_terminal:
+        # piped output has no width to fit, so print ids and uris on one line to stay greppable
+        console.width = 1_000_000
+    console.print(table)
 
 
 def validate_key_format(hex):
     """validate that an api key is well formatted.
     It must be a 40 character long hexadecimal string.
     """
-    if len(hex) != 40:
-        return False
-    try:
-        int(hex, 16)
-        return True
-    except:
-        return False
+    # a single set containment check in C, rather than building a 160 bit int from the key
+    return len(hex) == 40 and _HEX_DIGITS.issuperset(hex)
 
 
 def check_object_id(value):
-    try:
-        _ = ObjectId(value)
-    except InvalidId:
+    # None is accepted for optional ids, like ObjectId(None) used to
+    if value is not None and not _OID_RE.fullmatch(value):
         click.echo(sbx_style("Ooops, malformed id"))
         exit()
 
 
 def check_dataset_job_id(value):
-    try:
-        split = value.split('-')
-        assert len(split) > 2
-        _ = ObjectId(value.split('-')[-1])
-    except (InvalidId, AssertionError):
+    split = value.split('-')
+    if len(split) <= 2 or not _OID_RE.fullmatch(split[-1]):
         click.echo(sbx_style(
             "Ooops, malformed dataset job id. make sure to enter an id from `sbx job list`"))
         exit()
 
 
+def write_atomic(path, data):
+    """write bytes to path through a temporary file, so concurrent invocations never
+    read a partially written file. Failures are ignored, as we only use this for caches.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'wb') as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def write_json_atomic(path, obj):
+    """write obj as json to path, see write_atomic"""
+    import orjson
+    write_atomic(path, orjson.dumps(obj))
+
+
+def load_config():
+    """load the config at CONFIG_PATH, preferring the pickled cache when it was written
+    from the current version of the toml file (same mtime and size).
+    """
+    import pickle
+
+    stat = os.stat(CONFIG_PATH)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    try:
+        with open(CONFIG_CACHE_PATH, 'rb') as file:
+            cached_stamp, config = pickle.load(file)
+        if cached_stamp == stamp:
+            return config
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+        # missing or corrupt cache, fall back to the toml file
+        pass
+
+    # only pay for the toml parser's import when the cache can't be used
+    try:
+        import tomllib
+    except ImportError:  # python < 3.11
+        import tomli as tomllib
+    # read the whole (small) file in one go and parse it from memory
+    with open(CONFIG_PATH, 'rb') as file:
+        config = tomllib.loads(file.read().decode())
+    write_atomic(CONFIG_CACHE_PATH, pickle.dumps((stamp, config), protocol=pickle.HIGHEST_PROTOCOL))
+    return config
+
+
+def response_cache_path(key, route, body):
+    """path of the cached response for posting body to route with the given api key"""
+    import hashlib
+    import orjson
+    # the api url is part of the key, so SBX_DEV and prod responses never stand in for each other
+    canonical = orjson.dumps([_API_V0, key, route, body], option=orjson.OPT_SORT_KEYS)
+    return os.path.join(CACHE_DIR, hashlib.sha256(canonical).hexdigest() + '.json')
+
+
+def load_cached_response(path):
+    """return the cache entry stored at path, a dict with `expires`, `etag` and `data`,
+    or None if there is no usable entry.
+    """
+    import orjson
+    try:
+        with open(path, 'rb') as file:
+            entry = orjson.loads(file.read())
+    except (OSError, ValueError):
+        return None
+    if (isinstance(entry, dict) and {'expires', 'etag', 'data'} <= entry.keys()
+            and isinstance(entry['expires'], (int, float))):
+        return entry
+    return None
+
+
+def store_cached_response(path, response, data, etag=None):
+    """cache data parsed from response, honouring the response's Cache-Control header
+
+    Parameters
+    ----------
+    path : str
+        from response_cache_path
+    response : httpx.Response
+        response the data came from
+    data : dict
+        parsed response body
+    etag : str
+        etag of the previous entry, kept if the response doesn't send a new one
+    """
+    import time
+    cache_control = response.headers.get('Cache-Control', '')
+    if 'no-store' in cache_control:
+        return
+    max_age = re.search(r'max-age=(\d+)', cache_control)
+    if 'no-cache' in cache_control:
+        # may be stored, but has to be revalidated with the server before every use
+        ttl = 0
+    elif max_age:
+        ttl = int(max_age.group(1))
+    else:
+        ttl = RESPONSE_CACHE_TTL
+    write_json_atomic(path, {
+        'expires': time.time() + ttl,
+        'etag': response.headers.get('ETag', etag),
+        'data': data
+    })
+
+
+def get_client():
+    """return the process wide http client. It speaks HTTP/2 when the server supports it, so
+    calls to the api are multiplexed over one pooled TCP+TLS connection instead of doing a
+    handshake each time.
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        import httpx
+        # the transport keeps connections alive in its pool and retries failed connection attempts
+        # with exponential backoff. Requests that reached the server are not retried, since our
+        # POSTs aren't all idempotent (e.g. generator create-dataset).
+        transport = httpx.HTTPTransport(http2=True, verify=VERIFY, retries=3,
+                                        limits=httpx.Limits(max_connections=16, max_keepalive_connections=16,
+                                                            keepalive_expiry=30.0))
+        # bounded timeouts so a network problem fails the command instead of hanging it
+        _CLIENT = httpx.Client(transport=transport, timeout=httpx.Timeout(60.0, connect=10.0),
+                               follow_redirects=True,
+                               headers={"AuthType": "API_KEY"})
+    return _CLIENT
+
+
 def login_required(f):
     """enforces that we have a ~/.config/sbx/config.toml and loads it, then passes it
     to the decorated function as the first parameter. This serves as an easy way to load
     stored cli state.
     """
-    @wraps(f)
+    # click only needs the name (command name) and the docstring (help text). Note that `updated=()`
+    # skips copying f.__dict__, so click decorators must be applied on top of login_required.
+    @wraps(f, assigned=('__name__', '__doc__'), updated=())
     def wrapper(*args, **kwargs):
-        config = None
-        if 'key' in kwargs.keys():
-            # we supply a kwarg "key" when we are setting up our api key during sbx login.
-            return f({}, *args, **kwargs)
-        if os.path.exists(CONFIG_PATH):
-            with open(CONFIG_PATH, 'r') as file:
-                config = toml.load(file)
-        else:
+        try:
+            # load_config stats the file first, so a missing config costs a single syscall
+            config = load_config()
+        except FileNotFoundError:
             click.echo(
-                sbx_style(f"It looks like you're not logged in. Please `sbx login` first."))
+                sbx_style("It looks like you're not logged in. Please `sbx login` first."))
             return
         return f(config, *args, **kwargs)
     return wrapper
 
 
-@login_required
-def sbx_post(cfg, route, key=None, json=None):
-    """post to a route and return a parsed json response
+def _sbx_post_raw(key, route, json=None):
+    """post to a route with the given api key and return a parsed json response.
+    Used directly only by `sbx login`, to validate a key before it is stored; everything
+    else goes through sbx_post.
 
     Parameters
     ----------
+    key : str
+        api key to authenticate with
     route : str
         Something like `/user/validate-api-key`
-    cfg : dict
-        loaded from login_required decorator, config dict
-    key : str
-        api key that overrides the one in the cfg (useful for validating api key for the first time before storing it)
+    json : dict
+        request body
 
     Returns
     -------
     dict
-        parsed json object returned from post request
+        parsed json object returned from post request. Responses of CACHEABLE_ROUTES are served
+        from an on-disk cache for RESPONSE_CACHE_TTL seconds, then revalidated with their ETag.
     """
-    if not key:
-        key = cfg['api']['key']
+    import time
+
+    import orjson
+    cache_path = cached = None
+    if route in CACHEABLE_ROUTES:
+        cache_path = response_cache_path(key, route, json)
+        cached = load_cached_response(cache_path)
+        if cached and time.time() < cached['expires']:
+            return cached['data']
+    headers = {}
+    if json is not None:
+        # bodyless posts like /user/validate-api-key are sent without a content type, like before
+        headers['Content-Type'] = 'application/json'
+    if cached and cached['etag']:
+        # lets the server answer 304 Not Modified instead of sending the same data again
+        headers['If-None-Match'] = cached['etag']
+    # imported only once we know we need the network, cache hits above never load httpx
+    import httpx
+    client = get_client()
+    if client.headers.get("Authorization") != key:
+        # a process only ever uses one key, so this is set once and then sent as a default header
+        client.headers["Authorization"] = key
     try:
-        response = requests.post(SBX_API_URL_BASE + "/app-api/v0" + route, headers={
-                                 "Authorization": key, "AuthType": "API_KEY"}, json=json, verify=VERIFY)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.HTTPError as e:
+        response = client.post(_API_V0 + route,
+                               headers=headers, content=None if json is None else orjson.dumps(json))
+    except httpx.TransportError as e:
+        click.echo(sbx_style(f"Could not reach {SBX_API_URL_BASE}: {e!r}"), err=True)
+        return None
+
+    # branch on the status code directly rather than raising and catching an HTTPStatusError
+    if response.status_code == 304:
+        data = cached['data']
+    elif response.is_success:
+        data = orjson.loads(response.content)
+    else:
         if response.status_code == 401:
-            click.echo(sbx_style(response.text))
-            click.echo(sbx_style(
-                f"Are you using an valid API key for the resource you are trying to access? Please enter a key currently listed at {SBX_API_URL_BASE}/settings/account"))
+            click.echo(sbx_style(response.text), err=True)
+            click.echo(_MSG_BAD_KEY, err=True)
         elif response.status_code in [400, 404]:
-            click.echo(sbx_style(response.json()['message']))
+            click.echo(sbx_style(orjson.loads(response.content)['message']), err=True)
         elif response.status_code == 500:
-            click.echo(
-                sbx_style("Internal Server Error: Please retry in a bit."))
+            click.echo(_MSG_500, err=True)
         else:
-            click.echo(sbx_style(str(e)))
+            click.echo(sbx_style(f"{response.status_code} {response.reason_phrase} for url '{response.url}'"),
+                       err=True)
         return None
+    if cache_path:
+        store_cached_response(cache_path, response, data, etag=cached and cached['etag'])
+    return data
 
 
-@click.group()
-def cli():
-    """Entrypoint"""
-    pass
+@login_required
+def sbx_post(cfg, route, json=None):
+    """post to a route as the logged in user and return a parsed json response
 
+    Parameters
+    ----------
+    cfg : dict
+        loaded from login_required decorator, config dict
+    route : str
+        Something like `/projects/get`
+    json : dict
+        request body
 
-@cli.group()
-def project():
-    """list generator related commands"""
-    pass
+    Returns
+    -------
+    dict
+        parsed json object returned from post request, see _sbx_post_raw
+    """
+    return _sbx_post_raw(cfg['api']['key'], route, json=json)
 
 
-@cli.group()
-def generator():
-    """list generator related commands"""
-    pass
+class LazyGroup(click.Group):
+    """click group whose subgroups live in their own `sbx.cli._<name>` modules, which are only
+    imported once the subgroup is actually invoked. This keeps e.g. `sbx project list` from
+    loading everything `sbx dataset download` needs.
 
+    lazy_subcommands maps each lazy subgroup name to its short help, which is what `sbx --help`
+    shows, so listing the commands doesn't import any of them either.
+    """
 
-@cli.group()
-def dataset():
-    """list dataset related commands"""
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            module = importlib.import_module(f"sbx.cli._{cmd_name}")
+            return getattr(module, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        """same as click.Group.format_commands, except lazy subgroups are described from
+        lazy_subcommands instead of being imported for their docstring
+        """
+        commands = []
+        for name in self.list_commands(ctx):
+            if name in self.lazy_subcommands:
+                commands.append((name, None))
+                continue
+            cmd = self.get_command(ctx, name)
+            if cmd is not None and not cmd.hidden:
+                commands.append((name, cmd))
+        if not commands:
+            return
+        limit = formatter.width - 6 - max(len(name) for name, _ in commands)
+        rows = [(name, self.lazy_subcommands[name] if cmd is None else cmd.get_short_help_str(limit))
+                for name, cmd in commands]
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+
+@click.group(cls=LazyGroup, lazy_subcommands={
+    # keep these in sync with the docstrings of the groups in sbx/cli/_<name>.py
+    "project": "list project related commands",
+    "generator": "list generator related commands",
+    "dataset": "list dataset related commands",
+    "job": "list aws job related commands",
+})
+def cli():
+    """Entrypoint"""
     pass
 
 
-@cli.group()
-def job():
-    """list aws job related commands"""
-    pass
-
 #
 # Top level Commands
 #
 
 
-@cli.command()
+@click.command()
 def login():
     """log into SBX, getting user and company info"""
     click.echo(sbx_style(
@@ -200,8 +462,10 @@ def login():
     if not validate_key_format(key):
         click.echo(sbx_style("Please enter a well-formed API key"))
         return
-    res = sbx_post("/user/validate-api-key", key=key)
+    # there is no stored config yet, so skip login_required and use the key directly
+    res = _sbx_post_raw(key, "/user/validate-api-key")
     if res:
+        import rtoml
         config = {
             'api': {
                 'key': key
@@ -211,266 +475,27 @@ def login():
         }
         os.makedirs(CONFIG_DIR, exist_ok=True)
         with open(CONFIG_PATH, 'w') as f:
-            toml.dump(config, f)
+            # leave out None fields like toml.dump did, rather than writing them as "null" strings
+            rtoml.dump(config, f, none_value=None)
+        # parse the new config once now, so that the next command already finds it cached
+        load_config()
 
         click.echo(sbx_style(
             "API key has been validated and stored at ~/.config/sbx/config.toml. You're good to go!"))
 
 
-@cli.command()
+@click.command()
 @login_required
 def account(cfg):
     """show information about current login"""
     click.echo(sbx_style(
         "You're currently logged in with the following account information:\n"))
-    click.echo(click.style("Email", fg="cyan") + ": " + cfg['user']['email'])
-    click.echo(click.style("Name", fg="cyan") + ": " + cfg['user']['name'])
-    click.echo(click.style("Organization", fg="cyan") +
-               ": " + cfg['company']['name'])
+    click.echo(_EMAIL_LABEL + cfg['user']['email'])
+    click.echo(_NAME_LABEL + cfg['user']['name'])
+    click.echo(_ORGANIZATION_LABEL + cfg['company']['name'])
     click.echo("")
 
-#
-# Project commands
-#
-
 
-@project.command()
-def list():
-    """list user projects"""
-    res = sbx_post("/projects/get", json={"sort": SortOrder.DESC.value})
-    if not res:
-        return
-    headers = ['Id', 'Date Created', 'Name']
-    rows = [(
-        proj['project_id'],
-        proj['created_str_utc'],
-        proj['name']
-    ) for proj in res['projects']]
-    click.echo(tabulate(rows, headers=headers, tablefmt="grid"))
-
-
-@project.command()
-@click.argument("project_id")
-def info(project_id):
-    """show detailed info about a project"""
-    check_object_id(project_id)
-    res = sbx_post("/project/get", json={"id": project_id})
-    if not res:
-        return
-    click.echo(tabulate([(k, v) for k, v in res.items()], tablefmt="grid"))
-
-
-#
-# Generator commands
-#
-
-@generator.command()
-@click.argument("project_id")
-def list(project_id):
-    """list all generators attached to a project
-    """
-    check_object_id(project_id)
-    res = sbx_post("/generators/get",
-                   json={"project_id": project_id, "sort": SortOrder.DESC.value})
-    if not res:
-        return
-    headers = ['Id', 'Name', 'Build Name']
-    rows = [(
-        gen['id'],
-        gen['name'],
-        gen['cur_build_name']
-    ) for gen in res['generators']]
-    click.echo(tabulate(rows, headers=headers, tablefmt="grid"))
-
-
-@generator.command()
-@click.argument("generator_id")
-def info(generator_id):
-    """show detailed info about a particular generator
-    """
-    check_object_id(generator_id)
-    res = sbx_post("/generator/get", json={"id": generator_id})
-    if not res:
-        return
-    click.echo(tabulate([(k, v) for k, v in res.items()], tablefmt="grid"))
-
-@generator.command()
-@click.argument("generator_id")
-@click.argument("num_frames", type = int)
-@click.argument("scene_args_str")
-def generate(generator_id, num_frames, scene_args_str):
-    """submit a generation job for a synthetic dataset"""
-    check_object_id(generator_id)
-    res = sbx_post("/generator/create-dataset", json={"id": generator_id, "num_frames": num_frames, "scene_args_str": scene_args_str})
-    if not res:
-        return
-    click.echo(sbx_style(f"Success! Use `sbx job info {res['job_id']}` or `sbx job list` to monitor the status of your job."))
-    
-
-#
-# Dataset commands
-#
-
-
-@dataset.command()
-@click.argument("project_id")
-def list(project_id):
-    """list all datasets belonging to a project
-    """
-    check_object_id(project_id)
-    res = sbx_post("/datasets/get",
-                   json={"project_id": project_id, "sort": SortOrder.DESC.value})
-    if not res:
-        return
-    headers = ['Id', 'Date Shipped', 'Name']
-    rows = [(
-        ds['id'],
-        ds['created_str_utc'],
-        ds['name']
-    ) for ds in res['datasets']]
-    click.echo(tabulate(rows, headers=headers, tablefmt="grid"))
-
-
-@dataset.command()
-@click.argument("dataset_id")
-def info(dataset_id):
-    """show detailed info about a project
-    Note: dataset_id refers to the id shown in the dataset list command,
-    not the sbx internal id.
-    """
-    check_object_id(dataset_id)
-    res = sbx_post("/dataset/get", json={"id": dataset_id})
-    if not res:
-        return
-    click.echo(tabulate([(k, v)
-          for k, v in res['dataset'].items()], tablefmt="grid"))
-
-
-def download_one_file(bucket: str, output: str, client: boto3.client, s3_file: str):
-    """
-    Download a single file from S3
-    Args:
-        bucket (str): S3 bucket where images are hosted
-        output (str): Dir to store the images
-        client (boto3.client): S3 client
-        s3_file (str): S3 object name
-    """
-    client.download_file(
-        Bucket=bucket, Key=s3_file, Filename=os.path.join(output, s3_file)
-    )
-
-
-@dataset.command()
-@click.argument("dataset_id")
-@click.argument("download_dir")
-@click.option("-s", "--sample", is_flag=True, help="whether to download the full dataset or the smaller sample with 100 images")
-def download(dataset_id, download_dir, sample):
-    """download a dataset locally to a specified location
-    """
-    check_object_id(dataset_id)
-    # the only credential we need to store locally is the API key
-    res = sbx_post('/user/get-aws-creds', json={"id": dataset_id})
-    s3_bucket_path = res['synth_full_dataset_uri']
-    if sample:
-        s3_bucket_path = res['synth_sample_dataset_uri']
-
-    if not os.path.exists(download_dir):
-        create = click.prompt(sbx_style(
-            f"The path `{download_dir}` doesn't exist. Create it and download?"))
-        if create in ['Y', 'y']:
-            os.makedirs(download_dir)
-        else:
-            return
-
-    # boto3 does not support a clean aws sync command so we will download all files manually
-    # approach adapted from https://emasquil.github.io/posts/multithreading-boto3/
-
-    bucket_name = urlparse(res['dataset_uri']).netloc
-    prefix_path = urlparse(s3_bucket_path).path[1:]  # get rid of leading /
-
-    # Creating only one session and one client
-    session = boto3.Session()
-    client = session.client("s3",
-                            aws_access_key_id=res['access_key'],
-                            aws_secret_access_key=res['secret_key']
-                            )
-    resource = boto3.resource("s3")
-    bucket = resource.Bucket(bucket_name)
-    files_to_download = []
-    click.echo(sbx_style("Setting up directory structure"))
-    for obj in bucket.objects.filter(Prefix=prefix_path):
-        local_filename = os.path.join(download_dir, obj.key)
-        local_file_dir = os.path.dirname(local_filename)
-        if not os.path.exists(local_file_dir):
-            os.makedirs(local_file_dir)
-        files_to_download.append(obj.key)
-
-    # The client is shared between threads
-    func = partial(download_one_file, bucket_name, download_dir, client)
-
-    # List for storing possible failed downloads to retry later
-    failed_downloads = []
-
-    click.echo(sbx_style("Starting download..."))
-    with tqdm(total=len(files_to_download)) as pbar:
-        with ThreadPoolExecutor(max_workers=32) as executor:
-            # Using a dict for preserving the downloaded file for each future, to store it as a failure if we need that
-            futures = {}
-            for file_to_download in files_to_download:
-                if not file_to_download.endswith('/') and not os.path.exists(os.path.join(download_dir, file_to_download)):
-                    futures[executor.submit(
-                        func, file_to_download)] = file_to_download
-
-            for future in as_completed(futures):
-                if future.exception():
-                    failed_downloads.append(futures[future])
-                pbar.update(1)
-    if len(failed_downloads) > 0:
-        click.echo(
-            sbx_style("Some downloads have failed. Try rerunning"))
-    else:
-        click.echo(
-            sbx_style("Dataset Ready!")
-        )
-
-
-#
-# Job commands
-#
-
-
-@job.command()
-@click.argument("project_id", default=None, required=False)
-def list(project_id):
-    """list current running and completed aws jobs
-    """
-    check_object_id(project_id)
-    query = {"sort": SortOrder.DESC.value}
-    if project_id:
-        query['project_id'] = project_id
-    res = sbx_post("/dataset-jobs/get",
-                   json=query)
-    if not res:
-        return
-    headers = ['Id', 'Created', 'Finished', 'Name', 'State']
-    rows = [(
-        ds['id'],
-        ds['created_utc'],
-        ds['finished_utc'],
-        ds['name'],
-        JobState.get_name(int(ds['state']))
-    ) for ds in res['dataset_jobs']]
-    click.echo(tabulate(rows, headers=headers, tablefmt="grid"))
-
-
-@job.command()
-@click.argument("job_id")
-def info(job_id):
-    """list current running and completed aws jobs
-    """
-    check_dataset_job_id(job_id)
-    res = sbx_post("/dataset-job/get", json={"id": job_id}) 
-    if not res:
-        return
-    click.echo(tabulate([(k, v)
-          for k, v in res['dataset_job'].items()], tablefmt="grid"))
+# the project, generator, dataset and job groups are registered lazily through LazyGroup
+cli.add_command(login)
+cli.add_command(account)
@@ -0,0 +1,90 @@
+import os
+from concurrent.futures import Future
+
+import boto3
+import boto3.s3.transfer
+import orjson
+from click.testing import CliRunner
+
+from sbx.cli import _dataset
+from sbx.cli._dataset import DOWNLOAD_MANIFEST, dataset, download_is_complete
+
+DATASET_ID = 'a' * 24
+OBJECTS = {'pre/a/1.png': b'0123456789', 'pre/b/2.png': b'abc'}
+
+
+class FakeS3:
+    """stands in for the boto3 session, s3 client and paginator, listing OBJECTS under s3://bkt/pre"""
+
+    def client(self, *args, **kwargs):
+        return self
+
+    def get_paginator(self, name):
+        return self
+
+    def paginate(self, Bucket, Prefix):
+        yield {'Contents': [{'Key': key, 'Size': len(body), 'ETag': key} for key, body in OBJECTS.items()]}
+
+
+class FakeTransferManager:
+    """writes OBJECTS to disk instead of fetching them, and records which keys were downloaded"""
+    downloaded = []
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def download(self, bucket, key, filename, subscribers=()):
+        with open(filename, 'wb') as file:
+            file.write(OBJECTS[key])
+        self.downloaded.append(key)
+        future = Future()
+        future.set_result(None)
+        return future
+
+
+def run_download(monkeypatch, download_dir):
+    monkeypatch.setattr(_dataset, 'sbx_post', lambda route, json=None: {
+        'synth_full_dataset_uri': 's3://bkt/pre', 'synth_sample_dataset_uri': 's3://bkt/sample',
+        'dataset_uri': 's3://bkt/pre', 'access_key': 'key', 'secret_key': 'secret'})
+    monkeypatch.setattr(boto3, 'Session', FakeS3)
+    monkeypatch.setattr(boto3.s3.transfer, 'TransferManager', FakeTransferManager)
+    FakeTransferManager.downloaded = []
+    result = CliRunner().invoke(dataset, ['download', DATASET_ID, str(download_dir)])
+    assert result.exit_code == 0, result.output
+    return result
+
+
+def test_download_refetches_truncated_file(monkeypatch, tmp_path):
+    run_download(monkeypatch, tmp_path)
+    assert sorted(FakeTransferManager.downloaded) == sorted(OBJECTS)
+
+    truncated = tmp_path / 'pre' / 'a' / '1.png'
+    truncated.write_bytes(b'0')
+    manifest_path = os.path.join(tmp_path, DOWNLOAD_MANIFEST)
+    assert not download_is_complete(manifest_path, str(tmp_path), 'bkt', 'pre')
+
+    result = run_download(monkeypatch, tmp_path)
+    assert FakeTransferManager.downloaded == ['pre/a/1.png']
+    assert truncated.read_bytes() == OBJECTS['pre/a/1.png']
+    assert 'Dataset Ready!' in result.output
+    assert download_is_complete(manifest_path, str(tmp_path), 'bkt', 'pre')
+
+
+def test_empty_listing_writes_no_manifest(monkeypatch, tmp_path):
+    monkeypatch.setattr(FakeS3, 'paginate', lambda self, Bucket, Prefix: iter([{}]))
+    result = run_download(monkeypatch, tmp_path)
+    assert 'No files were found' in result.output
+    assert not os.path.exists(os.path.join(tmp_path, DOWNLOAD_MANIFEST))
+
+
+def test_empty_manifest_is_incomplete(tmp_path):
+    manifest_path = os.path.join(tmp_path, DOWNLOAD_MANIFEST)
+    with open(manifest_path, 'wb') as file:
+        file.write(orjson.dumps({'bucket': 'bkt', 'prefix': 'pre', 'files': {}}))
+    assert not download_is_complete(manifest_path, str(tmp_path), 'bkt', 'pre')